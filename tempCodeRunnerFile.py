@@ -1,17 +1,108 @@
-import http.server
-import socketserver
-
-PORT = 8000
-
-Handler = http.server.SimpleHTTPRequestHandler
-Handler.extensions_map.update({
-    '.json': 'application/json',
-})
-
-print("Starting server...")
-print(f"Serving files on port {PORT}")
-print("To view your dashboard, open this link in your browser:")
-print(f"http://localhost:{PORT}/warehouseoptimizerresult.html")
-
-with socketserver.TCPServer(("", PORT), Handler) as httpd:
-    httpd.serve_forever()
+import datetime
+import email.utils
+import gzip
+import http.server
+import os
+
+PORT = 8000
+
+# Browser-cache lifetime for the dashboard's static assets. The results
+# JSON is always revalidated instead (see JSON_CACHE_CONTROL) so a re-run
+# of the analysis shows up on the next refresh.
+CACHE_MAX_AGE_SECONDS = 3600
+JSON_CACHE_CONTROL = 'no-cache, must-revalidate'
+
+# Text-based types worth compressing; images and other binaries are not.
+COMPRESSIBLE_TYPES = {
+    'text/html',
+    'text/css',
+    'application/json',
+    'application/javascript',
+}
+
+
+class DashboardRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """
+    Serves the dashboard files with conditional-request support (ETag and
+    Last-Modified answered with 304 when the client's copy is current),
+    cache headers and gzip compression.
+    """
+
+    extensions_map = {
+        **http.server.SimpleHTTPRequestHandler.extensions_map,
+        '.json': 'application/json',
+    }
+
+    def _cache_control_for(self, content_type):
+        if content_type == 'application/json':
+            return JSON_CACHE_CONTROL
+        return f"max-age={CACHE_MAX_AGE_SECONDS}"
+
+    def _client_copy_is_fresh(self, etag, mtime):
+        """Evaluates If-None-Match / If-Modified-Since for a 304 reply."""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            return etag in if_none_match
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since is None:
+            return False
+        try:
+            client_time = email.utils.parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if client_time.tzinfo is None:
+            client_time = client_time.replace(tzinfo=datetime.timezone.utc)
+        last_modified = datetime.datetime.fromtimestamp(
+            int(mtime), datetime.timezone.utc)
+        return last_modified <= client_time
+
+    def do_GET(self):
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            super().do_GET()
+            return
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            self.send_error(404, "File not found")
+            return
+        with f:
+            stat = os.fstat(f.fileno())
+            etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+            content_type = self.guess_type(path)
+            cache_control = self._cache_control_for(content_type)
+
+            if self._client_copy_is_fresh(etag, stat.st_mtime):
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", cache_control)
+                self.end_headers()
+                return
+
+            body = f.read()
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Cache-Control", cache_control)
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", self.date_time_string(stat.st_mtime))
+        if (content_type in COMPRESSIBLE_TYPES
+                and 'gzip' in self.headers.get('Accept-Encoding', '')):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+Handler = DashboardRequestHandler
+
+print("Starting server...")
+print(f"Serving files on port {PORT}")
+print("To view your dashboard, open this link in your browser:")
+print(f"http://localhost:{PORT}/warehouseoptimizerresult.html")
+
+# ThreadingHTTPServer handles each request on its own thread, so one slow
+# client cannot stall the dashboard for everyone else.
+with http.server.ThreadingHTTPServer(("", PORT), Handler) as httpd:
+    httpd.serve_forever()